@@ -30,7 +30,7 @@
 """Internal utility classes and functions used by Tanchan."""
 from __future__ import annotations
 
-__all__: list[str] = ["MaybeLocalised"]
+__all__: list[str] = ["LRUCache", "MaybeLocalised"]
 
 import typing
 
@@ -42,21 +42,11 @@ if typing.TYPE_CHECKING:
     from alluka import abc as alluka
     from tanjun import abc as tanjun
 
-    class _WrappedProto(typing.Protocol):
-        wrapped_command: tanjun.ExecutableCommand[typing.Any] | None
-
     _T = typing.TypeVar("_T")
     _CommandT = typing.TypeVar("_CommandT", bound=tanjun.ExecutableCommand[typing.Any])
 
-
-def _has_wrapped(value: typing.Any, /) -> typing.TypeGuard[_WrappedProto]:
-    try:
-        value.wrapped_command  # noqa: B018
-
-    except AttributeError:
-        return False
-
-    return True
+_KeyT = typing.TypeVar("_KeyT")
+_ValueT = typing.TypeVar("_ValueT")
 
 
 def apply_to_wrapped(
@@ -80,11 +70,11 @@ def apply_to_wrapped(
         Whether this should apply the callback to wrapped commands.
     """
     if follow_wrapped:
-        wrapped = command.wrapped_command if _has_wrapped(command) else None
+        wrapped: tanjun.ExecutableCommand[typing.Any] | None = getattr(command, "wrapped_command", None)
 
         while wrapped:
             callback(wrapped)
-            wrapped = wrapped.wrapped_command if _has_wrapped(wrapped) else None
+            wrapped = getattr(wrapped, "wrapped_command", None)
 
     return command
 
@@ -97,3 +87,48 @@ def get_or_set_dep(client: alluka.Client, type_: type[_T], callback: collections
     value = callback()
     client.set_type_dependency(type_, value)
     return value
+
+
+class LRUCache(typing.Generic[_KeyT, _ValueT]):
+    """Size bounded cache which evicts its least recently used entry when full."""
+
+    __slots__ = ("_entries", "_max_size")
+
+    def __init__(self, max_size: int, /) -> None:
+        """Initialise an LRU cache.
+
+        Parameters
+        ----------
+        max_size
+            Maximum amount of entries to store.
+        """
+        # Dicts are insertion ordered so the first entry is always the least recently used.
+        self._entries: dict[_KeyT, _ValueT] = {}
+        self._max_size = max_size
+
+    def __getitem__(self, key: _KeyT, /) -> _ValueT:
+        value = self._entries.pop(key)
+        self._entries[key] = value
+        return value
+
+    def __setitem__(self, key: _KeyT, value: _ValueT, /) -> None:
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._max_size:
+            del self._entries[next(iter(self._entries))]
+
+        self._entries[key] = value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: _KeyT, /) -> _ValueT | None:
+        """Get an entry from this cache, returning [None][] if it isn't found."""
+        try:
+            return self[key]
+
+        except KeyError:
+            return None
+
+    def clear(self) -> None:
+        """Remove all the entries from this cache."""
+        self._entries.clear()
@@ -31,31 +31,40 @@ from __future__ import annotations
 
 __all__: list[str] = []
 
+import sys
 import typing
 
-import hikari
-
 if typing.TYPE_CHECKING:
     from collections import abc as collections
 
+    import hikari
     import tanjun
 
 
 # TODO: expand tanjun's special casing of * to cover other command fields like responses here
 _CommandTypes = typing.Literal["message", "message_menu", "slash", "user_menu"]
-_TYPE_TO_STR: dict[hikari.CommandType | None, _CommandTypes] = {
-    hikari.CommandType.MESSAGE: "message_menu",
-    hikari.CommandType.SLASH: "slash",
-    hikari.CommandType.USER: "user_menu",
-    None: "message",
-}
+_TYPE_TO_STR: tuple[_CommandTypes, ...] = (
+    "message",  # 0: Used to represent message commands (`None`).
+    "slash",  # hikari.CommandType.SLASH
+    "user_menu",  # hikari.CommandType.USER
+    "message_menu",  # hikari.CommandType.MESSAGE
+)
+"""Command type names indexed by [hikari.CommandType][hikari.commands.CommandType] value."""
 _FieldTypes = typing.Literal["help.category", "help.name", "help.description"]
+_ID_TEMPLATES: dict[_FieldTypes, tuple[tuple[str, str], ...]] = {
+    field_type: tuple((f"{cmd_str}:", f":{field_type}") for cmd_str in _TYPE_TO_STR)
+    for field_type in typing.get_args(_FieldTypes)
+}
+"""Precomputed `(prefix, suffix)` pairs which a command's name is placed between to make localise IDs.
+
+These are indexed by field type then command type value (as with `_TYPE_TO_STR`).
+"""
 
 
 class MaybeLocalised:
     """Class used for handling name and description localisation."""
 
-    __slots__ = ("_localise_id", "default_value", "id", "localised_values")
+    __slots__ = ("_hashable", "_localise_id", "default_value", "id", "localised_values")
 
     def __init__(
         self,
@@ -103,6 +112,8 @@ class MaybeLocalised:
             self.default_value = field
             self.id: str | None = None
             self.localised_values: dict[str, str] = {}
+            # Only care about the first line for pagination.
+            self._hashable = field.split("\n", 1)[0]
 
         else:
             self.localised_values = dict(field)
@@ -116,6 +127,12 @@ class MaybeLocalised:
                 raise RuntimeError(error_message)
 
             self.default_value = entry
+            # Only care about the first line for pagination.
+            if descriptions := sorted((key, value.split("\n", 1)[0]) for key, value in self.localised_values.items()):
+                self._hashable = f"{entry};{descriptions!r}"
+
+            else:
+                self._hashable = entry.split("\n", 1)[0]
 
         if field_type == "help.category":
             if name is not None:
@@ -123,26 +140,23 @@ class MaybeLocalised:
                 raise RuntimeError(error_message)
 
             # TODO: tanjun needs to also accept using the raw ":" string for getting localisations
-            self._localise_id = f"*:*:help.category:{self.default_value}"
+            self._localise_id = sys.intern(f"*:*:help.category:{self.default_value}")
 
         else:
             if name is None:
                 error_message = f"`name` must be passed for {field_type} fields"
                 raise ValueError(error_message)
 
-            self._localise_id = f"{_TYPE_TO_STR[cmd_type]}:{name}:{field_type}"
+            prefix, suffix = _ID_TEMPLATES[field_type][0 if cmd_type is None else cmd_type.value]
+            # This is interned as it's repeatedly used as a key for localiser lookups.
+            self._localise_id = sys.intern(prefix + name + suffix)
 
     def to_hashable(self) -> str:
         """Make a string representation of this localised value.
 
         This is used for ensuring pagination states match.
         """
-        if not self.localised_values:
-            return self.default_value.split("\n", 1)[0]
-
-        # Only care about the first line for pagination.
-        descriptions = [(key, value.split("\n", 1)[0]) for key, value in self.localised_values.items()]
-        return f"{self.default_value};{sorted(descriptions)!r}"
+        return self._hashable
 
     def localise(self, locale: hikari.Locale, localiser: tanjun.dependencies.AbstractLocaliser | None) -> str:
         """Get the localised value for a context.
@@ -164,10 +178,12 @@ class MaybeLocalised:
         str
             The localised value or the default value.
         """
-        if self.localised_values or localiser:
-            if localiser and (field := localiser.localise(self._localise_id, locale)):
-                return field
+        if localiser is None:
+            # Fast path for when localisation isn't being used.
+            if not self.localised_values:
+                return self.default_value
 
-            return self.localised_values.get(locale, self.default_value)
+        elif field := localiser.localise(self._localise_id, locale):
+            return field
 
-        return self.default_value
+        return self.localised_values.get(locale, self.default_value)
@@ -32,7 +32,6 @@ from __future__ import annotations
 
 __all__: list[str] = ["load_buttons", "unload_buttons"]
 
-import itertools
 import typing
 import urllib.parse
 
@@ -42,10 +41,6 @@ import yuyo
 
 from tanchan import _internal
 
-if typing.TYPE_CHECKING:
-    from collections import abc as collections
-
-
 DELETE_CUSTOM_ID: typing.Final[str] = "TC_DEL"
 """Match ID used for delete buttons."""
 
@@ -57,10 +52,19 @@ DELETE_EMOJI: typing.Final[hikari.UnicodeEmoji] = hikari.UnicodeEmoji(
 OWNER_QS_KEY: typing.Final[str] = "a"
 """Query string key for the author field."""
 
+_OWNER_QS_PREFIX: typing.Final[str] = f"{OWNER_QS_KEY}="
+"""Prefix used to detect the query string format for delete button IDs."""
+
 
 def make_delete_id(author: hikari.SnowflakeishOr[hikari.User], /, *authors: hikari.SnowflakeishOr[hikari.User]) -> str:
     """Make a delete button custom ID."""
-    return f"{DELETE_CUSTOM_ID}:{OWNER_QS_KEY}={int(author)}," + ",".join(str(int(author)) for author in authors)
+    # Snowflakes are int subclasses so these can skip the int() call.
+    author_id = author if isinstance(author, int) else author.id
+    if not authors:
+        return f"{DELETE_CUSTOM_ID}:{OWNER_QS_KEY}={author_id}"
+
+    author_ids = ",".join(str(value if isinstance(value, int) else value.id) for value in authors)
+    return f"{DELETE_CUSTOM_ID}:{OWNER_QS_KEY}={author_id},{author_ids}"
 
 
 def delete_row(
@@ -94,8 +98,9 @@ def delete_row(
     hikari.impl.ActionRowBuilder
         Action row builder with a delete button.
     """
-    authors = (value if isinstance(value, int) else value.author.id for value in ctx_or_authors)
-    custom_id = make_delete_id(ctx_or_author if isinstance(ctx_or_author, int) else ctx_or_author.author.id, *authors)
+    author = ctx_or_author if isinstance(ctx_or_author, int) else ctx_or_author.author.id
+    authors = [value if isinstance(value, int) else value.author.id for value in ctx_or_authors]
+    custom_id = make_delete_id(author, *authors)
     return hikari.impl.MessageActionRowBuilder().add_interactive_button(
         hikari.ButtonStyle.DANGER, custom_id, emoji=DELETE_EMOJI
     )
@@ -113,20 +118,29 @@ async def on_delete_button(ctx: yuyo.ComponentContext, /) -> None:
     ctx
         The context that triggered this delete.
     """
-    query = urllib.parse.parse_qs(ctx.id_metadata)
-    # Indicates a query string is being used.
-    if query:
-        raw_ids = query.get(OWNER_QS_KEY)
-        author_ids = set(itertools.chain.from_iterable(map(_parse_owner_ids, raw_ids))) if raw_ids else None
+    id_metadata = ctx.id_metadata
+    # Fast path for the single field query string Tanchan generates.
+    if id_metadata.startswith(_OWNER_QS_PREFIX) and "&" not in id_metadata:
+        author_ids = set(_parse_owner_ids(id_metadata[len(_OWNER_QS_PREFIX) :]))
+
+    # Indicates a more complex query string is being used.
+    elif "=" in id_metadata:
+        author_ids = {
+            author_id
+            for key, value in urllib.parse.parse_qsl(id_metadata)
+            if key == OWNER_QS_KEY
+            for author_id in _parse_owner_ids(value)
+        }
 
     # Old ID list only approach.
     else:
-        author_ids = set(_parse_owner_ids(ctx.id_metadata))
+        author_ids = set(_parse_owner_ids(id_metadata))
 
+    interaction = ctx.interaction
     if (
         not author_ids  # no IDs == public
-        or ctx.interaction.user.id in author_ids
-        or (ctx.interaction.member and author_ids.intersection(ctx.interaction.member.role_ids))
+        or interaction.user.id in author_ids
+        or ((member := interaction.member) and not author_ids.isdisjoint(member.role_ids))
     ):
         await ctx.defer(defer_type=hikari.ResponseType.DEFERRED_MESSAGE_UPDATE)
         await ctx.delete_initial_response()
@@ -139,11 +153,10 @@ async def on_delete_button(ctx: yuyo.ComponentContext, /) -> None:
         )
 
 
-# TODO: should be typed as returning an iterator of snowflakes.
-def _parse_owner_ids(value: str, /) -> collections.Iterator[int]:
-    # Filter is needed as "".split(",") will give [""] which is not a valid snowflake.
-    # And "123," will give ["123", ""].
-    return map(hikari.Snowflake, filter(None, value.split(",")))
+def _parse_owner_ids(value: str, /) -> list[hikari.Snowflake]:
+    # Empty entries are skipped as "".split(",") will give [""] which is not a
+    # valid snowflake. And "123," will give ["123", ""].
+    return [hikari.Snowflake(entry) for entry in value.split(",") if entry]
 
 
 @tanjun.as_loader
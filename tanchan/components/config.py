@@ -43,7 +43,14 @@ if typing.TYPE_CHECKING:
     from tanjun import abc as tanjun
 
 
-@attrs.define(kw_only=True, slots=False)
+def _freeze_guild_ids(value: collections.Iterable[int] | None, /) -> frozenset[int] | None:
+    """Freeze the eval guild IDs into an immutable set for fast lookups."""
+    return None if value is None else frozenset(value)
+
+
+# EvalConfig isn't slotted as Config inherits from both it and HelpConfig and
+# two slotted bases with fields would lead to an instance layout conflict.
+@attrs.frozen(kw_only=True, slots=False)
 class EvalConfig:
     """Configuration for the eval commands.
 
@@ -61,11 +68,14 @@ class EvalConfig:
     ```
     """
 
-    eval_guild_ids: collections.Collection[int] | None = attrs.field(default=())
+    eval_guild_ids: collections.Collection[int] | None = attrs.field(default=(), converter=_freeze_guild_ids)
     """ID of the guilds the eval slash command should be declared in.
 
     If [None][] then the slash command will be declared in every guild
     (globally) and an empty collection ensures it isn't declared.
+
+    Any collection of IDs may be passed here but it'll be frozen into a
+    [frozenset][] during initialisation.
     """
 
     def add_to_client(self, client: alluka.Client | tanjun.Client, /) -> None:
@@ -79,7 +89,7 @@ class EvalConfig:
         client.set_type_dependency(EvalConfig, self)
 
 
-@attrs.define(kw_only=True, slots=False)
+@attrs.frozen(kw_only=True)
 class HelpConfig:
     """Configuration for the help commands.
 
@@ -128,7 +138,7 @@ class HelpConfig:
         client.set_type_dependency(HelpConfig, self)
 
 
-@attrs.define(kw_only=True, slots=False)
+@attrs.frozen(kw_only=True)
 class Config(EvalConfig, HelpConfig):
     """Full configuration for Tan-chan's commands and components.
 
@@ -148,6 +158,9 @@ class Config(EvalConfig, HelpConfig):
     ```
     """
 
+    _dependency_types: typing.ClassVar[tuple[type[typing.Any], ...]] = (EvalConfig, HelpConfig)
+    """The types this config should be registered as in the dependency injector."""
+
     def add_to_client(self, client: alluka.Client | tanjun.Client) -> None:
         """Add this config to a Tanjun client.
 
@@ -156,5 +169,6 @@ class Config(EvalConfig, HelpConfig):
         client
             The client to add this config to.
         """
-        EvalConfig.add_to_client(self, client)
-        HelpConfig.add_to_client(self, client)
+        set_type_dependency = client.set_type_dependency
+        for dependency_type in self._dependency_types:
+            set_type_dependency(dependency_type, self)
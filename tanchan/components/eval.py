@@ -35,17 +35,15 @@ __all__: list[str] = ["load_sudo", "unload_sudo"]
 import ast
 import asyncio
 import contextlib
-import copy
+import functools
 import inspect
 import io
-import itertools
 import json
-import random
+import os
 import re
 import time
 import traceback
 import typing
-import urllib.parse
 from typing import Annotated
 
 import alluka  # noqa: TC002
@@ -63,6 +61,7 @@ from . import config
 from . import help as help_commands
 
 if typing.TYPE_CHECKING:
+    import types
     from collections import abc as collections
 
 
@@ -89,25 +88,38 @@ _THUMBS_UP_EMOJI = "\N{THUMBS UP SIGN}"
 _THUMBS_DOWN_EMOJI = "\N{THUMBS DOWN SIGN}"
 """Emoji used to represent `False`."""
 
-_CODEBLOCK_REGEX = re.compile(r"```(?:[\w]*\n?)([\s\S(^\\`{3})]*?)\n*```")
+_CODEBLOCK_REGEX = re.compile(r"```(?:\w*\n)?(.*?)\n*```", re.DOTALL)
 """Regex used to extract code from a codeblock."""
 
 _STATE_FILE_NAME = "EVAL_STATE"
 """Name of the file attachment used to store the eval call's code."""
 
+_STATE_HEADER = b"TC_EVAL_STATE:1\n"
+"""Header used to mark the current eval state file format.
+
+This is followed by `y` or `n` for whether file output was enabled, a newline
+and then the eval call's raw code.
+"""
+
 _EDIT_BUTTON_EMOJI = "\N{SQUARED NEW}"
 """Emoji that's used for the edit button."""
 
 _EVAL_MODAL_ID = "TC_EVAL"
 """Custom ID used for eval modals (including reruns)."""
 
+_PRIVATE_MODAL_IDS: dict[bool, str] = {
+    value: f"{_EVAL_MODAL_ID}:{_PRIVATE_KEY}={int(value)}" for value in (True, False)
+}
+"""Custom IDs used for the eval slash command's modal, keyed by whether the response is private."""
+
 
 def _yields_results(*args: io.StringIO) -> collections.Iterator[str]:
     """Create an iterator of the lines of an eval call's output."""
     for name, stream in zip(("stdout", "stderr"), args, strict=True):
         yield f"- /dev/{name}:"
-        while lines := stream.readlines(25):
-            yield from (line[:-1] for line in lines)
+        if output := stream.getvalue():
+            # Unlike str.splitlines, this only treats "\n" as a line break.
+            yield from output.removesuffix("\n").split("\n")
 
 
 async def _eval_python_code(
@@ -122,13 +134,9 @@ async def _eval_python_code(
     stdout = io.StringIO()
     stderr = io.StringIO()
 
-    stack = contextlib.ExitStack()
-    stack.enter_context(contextlib.redirect_stdout(stdout))
-    stack.enter_context(contextlib.redirect_stderr(stderr))
-
     start_time = time.perf_counter()
     try:
-        with stack:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
             await _eval_python_code_no_capture(client, ctx, code, component=component)
 
         failed = False
@@ -138,11 +146,18 @@ async def _eval_python_code(
     finally:
         exec_time = round((time.perf_counter() - start_time) * 1000)
 
-    stdout.seek(0)
-    stderr.seek(0)
     return stdout, stderr, exec_time, failed
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_code(code: str, file_name: str, /) -> types.CodeType:
+    """Compile python code with top-level await support.
+
+    This is cached as the same code is often rerun through the edit button.
+    """
+    return compile(code, file_name, "exec", flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+
+
 async def _eval_python_code_no_capture(
     client: tanjun.abc.Client,
     ctx: tanjun.abc.Context | yuyo.ComponentContext | yuyo.ModalContext,
@@ -163,7 +178,7 @@ async def _eval_python_code_no_capture(
         "hikari": hikari,
         "tanjun": tanjun,
     }
-    compiled_code = compile(code, file_name, "exec", flags=ast.PyCF_ALLOW_TOP_LEVEL_AWAIT)
+    compiled_code = _compile_code(code, file_name)
     if compiled_code.co_flags & inspect.CO_COROUTINE:
         await eval(compiled_code, globals_)  # noqa: S307 - insecure function
 
@@ -175,8 +190,7 @@ def _bytes_from_io(
     stream: io.StringIO, name: str, mimetype: str | None = "text/x-python;charset=utf-8"
 ) -> hikari.Bytes:
     """Build Hikari bytes from an StringIO object."""
-    stream.seek(0)
-    return hikari.Bytes(stream, name, mimetype=mimetype)
+    return hikari.Bytes(stream.getvalue().encode(), name, mimetype=mimetype)
 
 
 async def _check_owner(
@@ -219,11 +233,17 @@ async def _eval_modal(
 
     else:
         # Being executed in response to the slash command.
-        query = urllib.parse.parse_qs(ctx.id_metadata).get(_PRIVATE_KEY)
-        ephemeral = tanjun.conversion.to_bool(query[0]) if query else False
+        ephemeral = False
+        # _eval_slash_command always sets this field to either "0" or "1".
+        for field in ctx.id_metadata.split("&"):
+            key, _, value = field.partition("=")
+            if key == _PRIVATE_KEY:
+                ephemeral = value == "1"
+                break
+
         await ctx.create_initial_response("Loading...", ephemeral=ephemeral)
 
-    state = json.dumps({"content": content, "file_output": file_output})
+    state = b"%s%s\n%s" % (_STATE_HEADER, b"y" if file_output else b"n", content.encode())
     await _eval_message_command(
         ctx,
         client,
@@ -234,27 +254,47 @@ async def _eval_modal(
     )
 
 
+def _text_input_kwargs(row: hikari.api.ModalActionRowBuilder, /) -> dict[str, typing.Any]:
+    """Snapshot the configuration of a modal row's text input so it can be rebuilt with a new value."""
+    component = row.components[0]
+    assert isinstance(component, hikari.api.TextInputBuilder)
+    return {
+        "custom_id": component.custom_id,
+        "label": component.label,
+        "style": component.style,
+        "placeholder": component.placeholder,
+        "required": component.is_required,
+        "min_length": component.min_length,
+        "max_length": component.max_length,
+    }
+
+
+_CONTENT_INPUT_KWARGS = _text_input_kwargs(_eval_modal.rows[0])
+"""Configuration of the eval modal's content text input."""
+
+_FILE_OUTPUT_ROWS: dict[bool, hikari.api.ModalActionRowBuilder] = {
+    value: hikari.impl.ModalActionRowBuilder().add_component(
+        hikari.impl.TextInputBuilder(**_text_input_kwargs(_eval_modal.rows[1]), value=emoji)
+    )
+    for value, emoji in ((True, _THUMBS_UP_EMOJI), (False, _THUMBS_DOWN_EMOJI))
+}
+"""Pre-built file output rows for each possible pre-set value."""
+
+
 def _make_rows(
     *, default: str | None = None, file_output: bool | None = None
 ) -> collections.Sequence[hikari.api.ModalActionRowBuilder]:
     """Make a custom instance of the eval modal's rows with the eval content pre-set."""
-    rows = list(_eval_modal.rows)
-    content_row = _eval_modal.rows[0]
-    if default is not None:
-        assert isinstance(content_row.components[0], hikari.api.TextInputBuilder)
-        rows[0] = hikari.impl.ModalActionRowBuilder().add_component(
-            copy.copy(content_row.components[0]).set_value(default)
-        )
+    if default is None:
+        content_row = _eval_modal.rows[0]
 
-    button_row = _eval_modal.rows[1]
-    if file_output is not None:
-        assert isinstance(button_row.components[0], hikari.api.TextInputBuilder)
-        file_output_repr = _THUMBS_UP_EMOJI if file_output else _THUMBS_DOWN_EMOJI
-        rows[1] = hikari.impl.ModalActionRowBuilder().add_component(
-            copy.copy(button_row.components[0]).set_value(file_output_repr)
+    else:
+        content_row = hikari.impl.ModalActionRowBuilder().add_component(
+            hikari.impl.TextInputBuilder(**_CONTENT_INPUT_KWARGS, value=default)
         )
 
-    return rows
+    file_output_row = _eval_modal.rows[1] if file_output is None else _FILE_OUTPUT_ROWS[file_output]
+    return (content_row, file_output_row)
 
 
 @yuyo.components.as_single_executor(_EVAL_MODAL_ID, ephemeral_default=True)
@@ -278,6 +318,13 @@ async def _on_edit_button(
         except hikari.HikariError:
             break
 
+        if data.startswith(_STATE_HEADER):
+            raw_file_output, _, content = data[len(_STATE_HEADER) :].partition(b"\n")
+            rows = _make_rows(default=content.decode(), file_output=raw_file_output == b"y")
+            break
+
+        # Backwards compatibility with older eval responses which stored the
+        # state as JSON.
         try:
             data = json.loads(data)
 
@@ -294,16 +341,12 @@ async def _on_edit_button(
     else:
         # Otherwise try to get the source message.
         message = await client.rest.fetch_message(ctx.interaction.channel_id, ctx.interaction.message)
-        if message.referenced_message and message.referenced_message.content:
-            parsed = _CODEBLOCK_REGEX.findall(message.referenced_message.content)
-            try:
-                default = parsed[0]
-
-            except IndexError:
-                pass
-
-            else:
-                rows = _make_rows(default=default)
+        if (
+            message.referenced_message
+            and message.referenced_message.content
+            and (match := _CODEBLOCK_REGEX.search(message.referenced_message.content))
+        ):
+            rows = _make_rows(default=match.group(1))
 
     await ctx.create_modal_response("Edit eval", _EVAL_MODAL_ID, components=rows)
 
@@ -316,12 +359,10 @@ async def _never(_: yuyo.ComponentContext, /) -> None:
 class _FileCallback:
     """Callback logic used for to file buttons."""
 
-    __slots__ = ("__weakref__", "_custom_id", "_files", "_make_files", "_post_components")
+    __slots__ = ("__weakref__", "_button", "_files", "_make_files", "_post_components")
 
     def __init__(
         self,
-        custom_id: str,
-        /,
         *,
         files: collections.Sequence[hikari.Resourceish] = (),
         make_files: collections.Callable[[], collections.Sequence[hikari.Resourceish]] | None = None,
@@ -334,8 +375,6 @@ class _FileCallback:
 
         Parameters
         ----------
-        custom_id
-            The button's custom ID.
         files
             Collection of the files to send when the to file button is pressed.
         make_files
@@ -344,21 +383,27 @@ class _FileCallback:
         post_components
             Components to include on the updated message.
         """
-        self._custom_id = custom_id
+        self._button: hikari.api.InteractiveButtonBuilder | None = None
         self._files = files
         self._make_files = make_files
         self._post_components = post_components
 
+    def set_button(self, button: hikari.api.InteractiveButtonBuilder, /) -> None:
+        """Set the button builder which should be disabled once this is called.
+
+        Parameters
+        ----------
+        button
+            The to file button's builder within `post_components`.
+        """
+        self._button = button
+
     async def __call__(self, ctx: yuyo.ComponentContext) -> None:
         if self._post_components:
-            rows = self._post_components.rows
-            for component in itertools.chain.from_iterable(row.components for row in rows):
-                if (
-                    isinstance(component, hikari.api.InteractiveButtonBuilder)
-                    and component.custom_id == self._custom_id
-                ):
-                    component.set_is_disabled(True)
+            if self._button:
+                self._button.set_is_disabled(True)
 
+            rows = self._post_components.rows
             await ctx.create_initial_response(components=rows, response_type=hikari.ResponseType.MESSAGE_UPDATE)
 
         files = self._make_files() if self._make_files else self._files
@@ -387,13 +432,13 @@ def _add_file_button(
         A callback which returns the files to send when the to file button is
         pressed.
     """
-    custom_id = random.randbytes(32).hex()  # noqa: S311
-    column.add_interactive_button(
-        hikari.ButtonStyle.SECONDARY,
-        _FileCallback(custom_id, files=files, make_files=make_files, post_components=column),
-        custom_id=custom_id,
-        emoji=_FILE_EMOJI,
-    )
+    custom_id = os.urandom(8).hex()
+    callback = _FileCallback(files=files, make_files=make_files, post_components=column)
+    column.add_interactive_button(hikari.ButtonStyle.SECONDARY, callback, custom_id=custom_id, emoji=_FILE_EMOJI)
+    # The button that was just added will always be the last component.
+    button = column.rows[-1].components[-1]
+    assert isinstance(button, hikari.api.InteractiveButtonBuilder)
+    callback.set_button(button)
 
 
 @help_commands.hide_from_help
@@ -412,15 +457,15 @@ async def _eval_message_command(
 ) -> None:
     """Owner only command used to dynamically evaluate a script."""
     if isinstance(ctx, tanjun.abc.MessageContext):
-        code = _CODEBLOCK_REGEX.findall(ctx.content)
+        match = _CODEBLOCK_REGEX.search(ctx.content)
         kwargs: dict[str, typing.Any] = {"reply": ctx.message.id}
         respond = ctx.respond
 
-        if not code:
+        if not match:
             error_message = "Expected a python code block."
             raise tanjun.CommandError(error_message, component=buttons.delete_row(ctx.author.id))
 
-        code = code[0]
+        code = match.group(1)
 
     else:
         assert content is not None
@@ -440,11 +485,7 @@ async def _eval_message_command(
         # Wants the output to be attached as two files, avoid building a paginator.
         message = await respond(
             "",
-            attachments=[
-                hikari.Bytes(stdout, "stdout.py", mimetype="text/x-python;charset=utf-8"),
-                hikari.Bytes(stderr, "stderr.py", mimetype="text/x-python;charset=utf-8"),
-                *attachments,
-            ],
+            attachments=[_bytes_from_io(stdout, "stdout.py"), _bytes_from_io(stderr, "stderr.py"), *attachments],
             component=buttons.delete_row(ctx.author.id).add_interactive_button(
                 hikari.ButtonStyle.SECONDARY, _EVAL_MODAL_ID, emoji=_EDIT_BUTTON_EMOJI
             ),
@@ -490,9 +531,12 @@ async def _eval_message_command(
 
 
 def _try_deregister(client: yuyo.ComponentClient, message: hikari.Message) -> None:
-    with contextlib.suppress(KeyError):
+    try:
         client.deregister_message(message)
 
+    except KeyError:
+        pass
+
 
 async def _eval_slash_command(
     ctx: tanjun.abc.SlashContext, file_output: Bool | None = None, *, private: Bool = False
@@ -510,19 +554,31 @@ async def _eval_slash_command(
     private
         Whether the output should be sent as a private message. Defaults to false.
     """
-    custom_id = f"{_EVAL_MODAL_ID}:{_PRIVATE_KEY}={int(private)}"
+    custom_id = _PRIVATE_MODAL_IDS[private]
     await ctx.create_modal_response("Eval", custom_id, components=_make_rows(file_output=file_output))
 
 
 class _OnGuildCreate:
     """Handles creating the eval slash command for the whitelisted guilds on guild create."""
 
-    __slots__ = ("__weakref__", "_command")
+    __slots__ = ("__weakref__", "_app_id", "_app_id_lock", "_command")
 
     # TODO: tanjun just needs type var defaults at this point
     def __init__(self, command: tanjun.abc.SlashCommand[typing.Any], /) -> None:
+        self._app_id: hikari.Snowflake | None = None
+        self._app_id_lock = asyncio.Lock()
         self._command = command
 
+    async def _fetch_app_id(self, rest: hikari.api.RESTClient, /) -> hikari.Snowflake:
+        """Get the bot's application ID, only fetching it the first time."""
+        if self._app_id is None:
+            # This lock stops a burst of guild events from all fetching the application.
+            async with self._app_id_lock:
+                if self._app_id is None:
+                    self._app_id = (await rest.fetch_application()).id
+
+        return self._app_id
+
     async def __call__(
         self,
         event: hikari.GuildJoinEvent | hikari.GuildAvailableEvent,
@@ -532,8 +588,8 @@ class _OnGuildCreate:
         # TODO: come up with a better system for overriding command.is_global
         # TODO: deregister slash command if it shouldn't be present
         if eval_config.eval_guild_ids is not None and event.guild_id in eval_config.eval_guild_ids:
-            app = await event.app.rest.fetch_application()
-            await self._command.build().create(event.app.rest, app.id, guild=event.guild_id)
+            app_id = await self._fetch_app_id(event.app.rest)
+            await self._command.build().create(event.app.rest, app_id, guild=event.guild_id)
 
 
 @tanjun.as_loader
@@ -32,12 +32,14 @@ from __future__ import annotations
 
 __all__: list[str] = ["load_help", "unload_help"]
 
+import copy
+import functools
 import hashlib
 import inspect
-import itertools
-import math
+import sys
+import time
 import typing
-import urllib.parse
+import weakref
 from typing import Annotated
 
 import alluka  # noqa: TC002
@@ -58,6 +60,10 @@ if typing.TYPE_CHECKING:
 
 
 _CommandT = typing.TypeVar("_CommandT", bound=tanjun.abc.ExecutableCommand[typing.Any])
+_CollectedCommands: typing.TypeAlias = (
+    "dict[tanjun.abc.MessageCommand[typing.Any] | tanjun.abc.SlashCommand[typing.Any], list[tuple[str, ...]]]"
+)
+"""Type of the dict help commands and their full names are collected into."""
 
 _COMPONENT_NAME = "tanchan.help"
 """Name of this module's component."""
@@ -89,6 +95,18 @@ _PAGE_NUM_KEY = "p"
 _NUMBERS_MODAL_ID = "tanchan.help.select_page"
 """Constant match ID used for the select page modal."""
 
+_ROWS_CACHE_SIZE = 512
+"""Maximum amount of help pagination rows to cache."""
+
+_FOUND_COMMANDS_CACHE_SIZE = 256
+"""Maximum amount of `find_command` results to cache."""
+
+_EMBED_LINKS_TTL = 60.0
+"""How long (in seconds) the bot's resolved embed links permission in a channel is cached for."""
+
+_EMBED_LINKS_CACHE_SIZE = 1024
+"""Maximum amount of channels to cache the bot's embed links permission for."""
+
 # TODO: improve help command formatting
 # TODO: maybe experiment with including command signatures in responses
 
@@ -109,6 +127,9 @@ def with_help(
 
         This supports Tanjun's
         [localisation](https://tanjun.cursed.solutions/usage/#localisation).
+        Localised help pages are cached, so the localiser's entries are
+        assumed not to change after the help command's index is built (it's
+        rebuilt when a component is added or removed).
     category
         Name of the category this command should be in. Defaults to the
         component's name.
@@ -199,55 +220,127 @@ def hide_from_help(
     return decorator
 
 
-def _split_name(name: str, /) -> list[str]:
+_docstrings: weakref.WeakKeyDictionary[collections.Callable[..., typing.Any], str | None] = weakref.WeakKeyDictionary()
+"""Cache of command callbacks to their cleaned up docstrings.
+
+Callbacks are weakly referenced so this doesn't keep removed commands alive.
+"""
+
+
+def _get_docstring(callback: collections.Callable[..., typing.Any], /) -> str | None:
+    """Get a command callback's docstring, caching it between index reloads."""
+    try:
+        return _docstrings[callback]
+
+    except KeyError:
+        pass
+
+    except TypeError:  # The callback can't be weakly referenced.
+        return inspect.getdoc(callback)
+
+    docstring = _docstrings[callback] = inspect.getdoc(callback)
+    return docstring
+
+
+_locales: dict[str, hikari.Locale] = {}
+"""Cache of raw interaction locales to the enum values they represent."""
+
+
+def _to_locale(locale: str, /) -> hikari.Locale:
+    """Convert an interaction's locale to a [hikari.Locale][hikari.locales.Locale]."""
+    try:
+        return _locales[locale]
+
+    except KeyError:
+        result = _locales[locale] = hikari.Locale(locale)
+        return result
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_name(name: str, /) -> tuple[str, ...]:
     """Split a message command name into spaced case-insensitive sections."""
-    return name.casefold().split()
+    # lower() matches casefold() for ASCII strings while skipping the full
+    # Unicode case folding tables.
+    name = name.lower() if name.isascii() else name.casefold()
+    return tuple(sys.intern(section) for section in name.split())
 
 
 class _Page:
     """Represents a page in the help command's response paginator."""
 
-    __slots__ = ("_category_name", "_fields", "_index", "_page_number")
+    __slots__ = (
+        "_category_name",
+        "_content",
+        "_description",
+        "_embed",
+        "_fields",
+        "_footer",
+        "_localised",
+        "_localiser",
+        "_title",
+    )
 
     def __init__(
         self,
-        index: _HelpIndex,
         page_number: int,
+        page_count: int,
         # TODO: can we show sub-pages for the category???
         category_name: _internal.MaybeLocalised,
         fields: list[tuple[str, _internal.MaybeLocalised]],
+        lines: list[str],
         /,
     ) -> None:
         """Initialise a help command page.
 
         Parameters
         ----------
-        index
-            The help index this is tied to.
         page_number
             This page's 1-indexed position.
+        page_count
+            The total amount of pages in the help index this is tied to.
         category_name
             Name of the category this page shows the commands from.
         fields
             List of field names ad their descriptions.
+        lines
+            The preformatted unlocalised `"{name}: {description}"` line for each field.
         """
         self._category_name = category_name
-        self._fields = fields
-        self._index = index
-        self._page_number = page_number
+        self._fields = [(f"{name}: ", field) for name, field in fields]
+        self._footer = f"Page {page_number}/{page_count}"
+        self._description = "\n".join(lines)
+        self._title = f"{category_name.default_value} commands"
+        self._content = f"```md\n{self._title}\n{self._description}\n```"
+        # This is safe to share between responses as hikari doesn't mutate
+        # embeds while sending them.
+        self._embed = hikari.Embed(title=self._title, description=self._description).set_footer(self._footer)
+        # Cache of locales to their (title, description) for the localiser they were made with.
+        # Localisers are assumed to be immutable, so this is only reset on index reload or a new localiser.
+        self._localised: dict[hikari.Locale, tuple[str, str]] = {}
+        self._localiser: tanjun.dependencies.AbstractLocaliser | None = None
+
+    def clear_cache(self) -> None:
+        """Clear this page's cached localised text."""
+        self._localised = {}
 
     def _localise(
         self, locale: hikari.Locale | None, localiser: tanjun.dependencies.AbstractLocaliser | None
     ) -> tuple[str, str]:
         if locale is None:
-            description = "\n".join(f"{name}: " + field.default_value.split("\n", 1)[0] for name, field in self._fields)
-            title = f"{self._category_name.default_value} commands"
-            return title, description
+            return self._title, self._description
+
+        if localiser is not self._localiser:
+            self._localised = {}
+            self._localiser = localiser
+
+        elif result := self._localised.get(locale):
+            return result
 
         description = "\n".join(
-            f"{name}: " + field.localise(locale, localiser).split("\n", 1)[0] for name, field in self._fields
+            prefix + field.localise(locale, localiser).split("\n", 1)[0] for prefix, field in self._fields
         )
         title = self._category_name.localise(locale, localiser)
+        self._localised[locale] = (title, description)
         return title, description
 
     def to_content(
@@ -267,6 +360,9 @@ class _Page:
         str
             The message-content friendly string representation of this page.
         """
+        if locale is None:
+            return self._content
+
         title, description = self._localise(locale, localiser)
         return f"```md\n{title}\n{description}\n```"
 
@@ -287,20 +383,37 @@ class _Page:
         hikari.embeds.Embed
             The Discord embed representation of this page.
         """
+        if locale is None:
+            return self._embed
+
         title, description = self._localise(locale, localiser)
-        return hikari.Embed(title=title, description=description).set_footer(
-            f"Page {self._page_number}/{len(self._index.pages)}"
-        )
+        return hikari.Embed(title=title, description=description).set_footer(self._footer)
 
 
 class _HelpIndex:
     """Index which tracks all the commands to display help info for in a bot."""
 
-    __slots__ = ("_column", "_descriptions", "_hash", "_numbers", "_pages")
+    __slots__ = (
+        "_column",
+        "_descriptions",
+        "_embed_links",
+        "_found_commands",
+        "_hash",
+        "_numbers",
+        "_page_metadata",
+        "_pages",
+    )
 
     def __init__(self) -> None:
-        self._descriptions: dict[tuple[str, ...], _internal.MaybeLocalised] = {}
+        self._descriptions: dict[str, _internal.MaybeLocalised] = {}
+        self._embed_links: _internal.LRUCache[tuple[int, int, int], tuple[float, bool]] = _internal.LRUCache(
+            _EMBED_LINKS_CACHE_SIZE
+        )
+        self._found_commands: _internal.LRUCache[str, _internal.MaybeLocalised | None] = _internal.LRUCache(
+            _FOUND_COMMANDS_CACHE_SIZE
+        )
         self._hash = ""
+        self._page_metadata: list[str] = []
         self._pages: list[_Page] = []
         self._column = _HelpColumn(self)
         self._numbers = _NumberModal(self)
@@ -310,6 +423,15 @@ class _HelpIndex:
         """The Yuyo components which handle paginating the bot's help command."""
         return self._column
 
+    @property
+    def embed_links_cache(self) -> _internal.LRUCache[tuple[int, int, int], tuple[float, bool]]:
+        """Cache of (bot ID, guild ID, channel ID) to (expire time, whether the bot can embed links).
+
+        This is only used for message commands as app commands are given the
+        bot's permissions on the interaction.
+        """
+        return self._embed_links
+
     @property
     def hash(self) -> str:
         """State hash used to make sure help iterators are insync."""
@@ -320,6 +442,11 @@ class _HelpIndex:
         """The Yuyo modal used to handle the "go to page" button."""
         return self._numbers
 
+    @property
+    def page_metadata(self) -> collections.Sequence[str]:
+        """The hash and page number custom ID metadata for each page."""
+        return self._page_metadata
+
     @property
     def pages(self) -> collections.Sequence[_Page]:
         """Sequence of this help index's pages."""
@@ -344,26 +471,33 @@ class _HelpIndex:
         permissions = ctx.interaction.app_permissions
         # perms is None indicates a DM where we will always have embed links.
         if permissions is None or permissions & hikari.Permissions.EMBED_LINKS:
-            content = page.to_embed(locale=hikari.Locale(ctx.interaction.locale), localiser=localiser)
+            content = page.to_embed(locale=_to_locale(ctx.interaction.locale), localiser=localiser)
 
         else:
-            content = page.to_content(locale=hikari.Locale(ctx.interaction.locale), localiser=localiser)
+            content = page.to_content(locale=_to_locale(ctx.interaction.locale), localiser=localiser)
 
         rows = self._column.make_rows(ctx.author.id, page_number)
         await ctx.create_initial_response(content, components=rows, response_type=hikari.ResponseType.MESSAGE_UPDATE)
 
     def reload(self, client: tanjun.abc.Client, help_config: config.HelpConfig, /) -> None:
         """Rebuild the help command's index to account for changes."""
-        categories: dict[str, list[tuple[str, _internal.MaybeLocalised]]] = {}
-        descriptions: dict[tuple[str, ...], _internal.MaybeLocalised] = {}
-        pages: list[_Page] = []
-
-        cmds_iter = itertools.chain(
-            (_collect_msg_cmds(cmd, help_config) for cmd in client.iter_message_commands()),
-            (_collect_slash_cmds(cmd, help_config) for cmd in client.iter_slash_commands()),
-        )
-        for command, names in itertools.chain.from_iterable(cmds_iter):
-            component_name = command.component.name if command.component else "unknown"
+        # Category names to their commands and the preformatted unlocalised line for each command.
+        categories: dict[str, tuple[list[tuple[str, _internal.MaybeLocalised]], list[str]]] = {}
+        # Keyed by the space-joined name.
+        descriptions: dict[str, _internal.MaybeLocalised] = {}
+        # The category of each name is tracked so it can be included in the state hash.
+        name_categories: dict[str, str] = {}
+        include_msg = help_config.include_message_commands
+        include_slash = help_config.include_slash_commands
+
+        collected: _CollectedCommands = {}
+        for cmd in client.iter_message_commands():
+            _collect_msg_cmds(cmd, collected, include_default=include_msg)
+
+        for cmd in client.iter_slash_commands():
+            _collect_slash_cmds(cmd, collected, include_default=include_slash)
+
+        for command, names in collected.items():
             try:
                 description_override = command.metadata[_DESCRIPTION_KEY]
 
@@ -374,47 +508,72 @@ class _HelpIndex:
                 if not isinstance(description_override, _internal.MaybeLocalised):
                     description_override = None
 
-            cmd_name, cmd_type = _to_cmd_info(command)
-            description = inspect.getdoc(command.callback)
             if description_override:
                 description = description_override
 
-            elif description:
-                description = _internal.MaybeLocalised(
-                    "help.description", description, cmd_type=cmd_type, name=cmd_name
-                )
+            elif docstring := _get_docstring(command.callback):
+                cmd_name, cmd_type = _to_cmd_info(command)
+                description = _internal.MaybeLocalised("help.description", docstring, cmd_type=cmd_type, name=cmd_name)
 
             else:
                 continue
 
             # TODO: handle inheriting this state from parent commands
-            category = command.metadata.get(_CATEGORY_KEY) or component_name
-            if not isinstance(category, str):
+            category = command.metadata.get(_CATEGORY_KEY)
+            if not category:
+                component = command.component
+                category = component.name if component else "unknown"
+
+            elif not isinstance(category, str):
                 error_message = f"Invalid category name: {category!r}"
                 raise TypeError(error_message)
 
-            for name in names:
+            joined_names = [" ".join(name) for name in names]
+            for name in joined_names:
                 descriptions[name] = description
+                name_categories[name] = category
 
-            entry = (" ".join(names[0]), description)
-            try:
-                categories[category].append(entry)
+            entry = (joined_names[0], description)
+            # Only the first line of the description is shown in the index.
+            line = f"{joined_names[0]}: " + description.default_value.split("\n", 1)[0]
+            if category_entries := categories.get(category):
+                category_entries[0].append(entry)
+                category_entries[1].append(line)
 
-            except KeyError:
-                categories[category] = [entry]
+            else:
+                categories[category] = ([entry], [line])
+
+        items_repr = ",".join(
+            f"{name}:{name_categories[name]}:{descriptions[name].to_hashable()}" for name in sorted(descriptions)
+        )
+        state_hash = "b2-" + hashlib.blake2b(items_repr.encode(), digest_size=8, usedforsecurity=False).hexdigest()
+        # The hash only covers the first line of each description so the full
+        # descriptions are always replaced.
+        self._descriptions = descriptions
+        self._found_commands.clear()
+        if state_hash == self._hash:
+            for page in self._pages:
+                page.clear_cache()
+
+            return
 
-        page_number = 0
-        for raw_cateory, commands in sorted(categories.items(), key=lambda v: v[0]):
+        page_fields: list[tuple[_internal.MaybeLocalised, list[tuple[str, _internal.MaybeLocalised]], list[str]]] = []
+        for raw_cateory in sorted(categories):
+            commands, lines = categories[raw_cateory]
             cateory = _internal.MaybeLocalised("help.category", raw_cateory)
-            page_count = math.ceil(len(commands) / 10)
-            for index in range(page_count):
-                page_number += 1
-                pages.append(_Page(self, page_number, cateory, commands[10 * index : 10 * (index + 1)]))
+            page_fields.extend(
+                (cateory, commands[start : start + 10], lines[start : start + 10])
+                for start in range(0, len(commands), 10)
+            )
 
-        items_repr = ((" ".join(k), v.to_hashable()) for k, v in descriptions.items())
-        items_repr = ",".join(map(":".join, sorted(items_repr, key=lambda v: v[0]))).encode()
-        self._descriptions = descriptions
-        self._hash = "md5-" + hashlib.md5(items_repr, usedforsecurity=False).hexdigest()
+        # This is a second pass as the total page count is needed to render each page.
+        pages = [
+            _Page(page_number, len(page_fields), cateory, fields, lines)
+            for page_number, (cateory, fields, lines) in enumerate(page_fields, start=1)
+        ]
+
+        self._hash = state_hash
+        self._page_metadata = [f"{_HASH_KEY}={self._hash}&{_PAGE_NUM_KEY}={index}" for index in range(len(pages))]
         self._pages = pages
 
     async def on_component_change(
@@ -428,69 +587,50 @@ class _HelpIndex:
 
     def find_command(self, command_name: str, /) -> _internal.MaybeLocalised | None:
         """Find a command's help page by name."""
-        return self._descriptions.get(tuple(_split_name(command_name)))
-
-
-# TODO: this feels very inefficient
-def _collect_msg_cmds(
-    command: tanjun.abc.MessageCommand[typing.Any], help_config: config.HelpConfig, /
-) -> collections.ItemsView[tanjun.abc.MessageCommand[typing.Any], list[tuple[str, ...]]]:
-    results: dict[tanjun.abc.MessageCommand[typing.Any], list[tuple[str, ...]]] = {}
-
-    for raw_names, sub_command in _follow_msg_children(command, help_config):
-        names = tuple(raw_names)
         try:
-            results[sub_command].append(names)
+            return self._found_commands[command_name]
 
         except KeyError:
-            results[sub_command] = [names]
+            pass
 
-    return results.items()
+        description = self._descriptions.get(" ".join(_split_name(command_name)))
+        self._found_commands[command_name] = description
+        return description
 
 
-def _follow_msg_children(
-    command: tanjun.abc.MessageCommand[typing.Any], help_config: config.HelpConfig, /
-) -> collections.Iterator[tuple[list[str], tanjun.abc.MessageCommand[typing.Any]]]:
-    if command.metadata.get(_INCLUDE_KEY, help_config.include_message_commands):
-        yield from ((_split_name(name), command) for name in command.names)
+def _collect_msg_cmds(
+    command: tanjun.abc.MessageCommand[typing.Any], results: _CollectedCommands, /, *, include_default: bool
+) -> None:
+    # Depth-first walk where each entry holds the full names of its parent command.
+    stack: list[tuple[tanjun.abc.MessageCommand[typing.Any], list[tuple[str, ...]]]] = [(command, [()])]
+    while stack:
+        command, parent_names = stack.pop()
+        own_names = [_split_name(name) for name in command.names]
+        names = [parent_name + name for parent_name in parent_names for name in own_names]
+        if command.metadata.get(_INCLUDE_KEY, include_default):
+            # This extends a new list as names is also shared with the sub-commands.
+            results.setdefault(command, []).extend(names)
 
-    if isinstance(command, tanjun.abc.MessageCommandGroup):
-        commands_iter = itertools.product(
-            command.names,
-            itertools.chain.from_iterable(_follow_msg_children(cmd, help_config) for cmd in command.commands),
-        )
-        yield from (([*_split_name(parent_name), *name], command) for parent_name, (name, command) in commands_iter)
+        if isinstance(command, tanjun.abc.MessageCommandGroup):
+            # This is reversed so sub-commands are popped in their original order.
+            stack.extend((sub_command, names) for sub_command in reversed(tuple(command.commands)))
 
 
 def _collect_slash_cmds(
-    command: tanjun.abc.BaseSlashCommand, help_config: config.HelpConfig, /
-) -> collections.ItemsView[tanjun.abc.SlashCommand[typing.Any], list[tuple[str, ...]]]:
-    results: dict[tanjun.abc.SlashCommand[typing.Any], list[tuple[str, ...]]] = {}
-
-    for raw_names, cmd in _follow_slash_children(command, help_config):
-        names = tuple(raw_names)
-        try:
-            results[cmd].append(names)
-
-        except KeyError:
-            results[cmd] = [names]
-
-    return results.items()
-
-
-def _follow_slash_children(
-    command: tanjun.abc.BaseSlashCommand, help_config: config.HelpConfig, /
-) -> collections.Iterator[tuple[list[str], tanjun.abc.SlashCommand[typing.Any]]]:
-    if isinstance(command, tanjun.abc.SlashCommandGroup):
-        commands_iter = itertools.chain.from_iterable(
-            _follow_slash_children(cmd, help_config) for cmd in command.commands
-        )
-        yield from (([command.name, *name], sub_command) for (name, sub_command) in commands_iter)
+    command: tanjun.abc.BaseSlashCommand, results: _CollectedCommands, /, *, include_default: bool
+) -> None:
+    stack: list[tuple[tanjun.abc.BaseSlashCommand, tuple[str, ...]]] = [(command, ())]
+    while stack:
+        command, parent_name = stack.pop()
+        name = (*parent_name, command.name)
+        if isinstance(command, tanjun.abc.SlashCommandGroup):
+            # This is reversed so sub-commands are popped in their original order.
+            stack.extend((sub_command, name) for sub_command in reversed(tuple(command.commands)))
 
-    elif command.metadata.get(_INCLUDE_KEY, help_config.include_slash_commands):
-        # Assume this is an actual callable slash command and not a group
-        assert isinstance(command, tanjun.abc.SlashCommand)
-        yield ([command.name], command)
+        elif command.metadata.get(_INCLUDE_KEY, include_default):
+            # Assume this is an actual callable slash command and not a group
+            assert isinstance(command, tanjun.abc.SlashCommand)
+            results.setdefault(typing.cast("tanjun.abc.SlashCommand[typing.Any]", command), []).append(name)
 
 
 class _NumberModal(yuyo.modals.Modal):
@@ -526,47 +666,81 @@ async def _noop(ctx: yuyo.ComponentContext, /) -> None:
     await ctx.create_initial_response(response_type=hikari.ResponseType.MESSAGE_UPDATE)
 
 
+def _copy_row(
+    template: collections.Iterable[hikari.api.InteractiveButtonBuilder], metadata: str, /
+) -> hikari.api.MessageActionRowBuilder:
+    """Copy a row of buttons with the passed metadata appended to their custom IDs."""
+    row = hikari.impl.MessageActionRowBuilder()
+    for button in template:
+        # The stop button's custom ID is left bare (as Yuyo did) so anyone can delete the response.
+        if button.custom_id == buttons.DELETE_CUSTOM_ID:
+            row.add_component(button)
+            continue
+
+        row.add_component(copy.copy(button).set_custom_id(f"{button.custom_id}:{metadata}"))
+
+    return row
+
+
 class _HelpColumn(yuyo.ActionColumnExecutor):
     """Help pagination components."""
 
-    __slots__ = ("_index",)
+    __slots__ = ("_index", "_row_templates", "_rows_cache")
 
-    def __init__(self, index: _HelpIndex, /, *, author: hikari.Snowflake | None = None, page: int = 0) -> None:
-        metadata = f"{_HASH_KEY}={index.hash}&{_PAGE_NUM_KEY}={page}"
-        if author:
-            metadata += f"&{buttons.OWNER_QS_KEY}={int(author)}"
-
-        super().__init__(
-            ephemeral_default=True,
-            id_metadata={
-                "jump_to_start": metadata,
-                "previous_button": metadata,
-                "stop_button": metadata,
-                "next_button": metadata,
-                "jump_to_last": metadata,
-                "select_number_button": metadata,
-            },
-        )
+    def __init__(self, index: _HelpIndex, /) -> None:
+        super().__init__(ephemeral_default=True)
         self._index = index
+        # Cache of (author, page, index hash) to rows.
+        self._rows_cache: _internal.LRUCache[
+            tuple[int, int, str], collections.Sequence[hikari.api.MessageActionRowBuilder]
+        ] = _internal.LRUCache(_ROWS_CACHE_SIZE)
+        # Responses only differ from these by the metadata in their custom IDs.
+        self._row_templates: list[list[hikari.api.InteractiveButtonBuilder]] = []
+        for row in self.rows:
+            template: list[hikari.api.InteractiveButtonBuilder] = []
+            for component in row.components:
+                assert isinstance(component, hikari.api.InteractiveButtonBuilder)
+                template.append(component)
+
+            self._row_templates.append(template)
 
     def make_rows(
         self, author: hikari.Snowflake, page: int, /
     ) -> collections.Sequence[hikari.api.MessageActionRowBuilder]:
         """Make a copy of these components with a specific author and page set."""
-        return _HelpColumn(self._index, author=author, page=page).rows
+        # The hash is part of the key so entries from before a reload are never reused.
+        key = (author, page, self._index.hash)
+        if (rows := self._rows_cache.get(key)) is not None:
+            return rows
+
+        metadata = f"{self._index.page_metadata[page]}&{buttons.OWNER_QS_KEY}={int(author)}"
+        rows = [_copy_row(template, metadata) for template in self._row_templates]
+        self._rows_cache[key] = rows
+        return rows
 
     def _process_metadata(self, ctx: yuyo.ComponentContext, /) -> int:
-        metadata = urllib.parse.parse_qs(ctx.id_metadata)
+        author = hash_ = page = None
+        # This is always in the fixed format generated by make_rows.
+        for entry in ctx.id_metadata.split("&"):
+            key, _, value = entry.partition("=")
+            if key == _HASH_KEY:
+                hash_ = value
+
+            elif key == _PAGE_NUM_KEY:
+                page = value
 
-        if int(metadata[buttons.OWNER_QS_KEY][0]) != ctx.author.id:
+            elif key == buttons.OWNER_QS_KEY:
+                author = value
+
+        if author is None or int(author) != ctx.author.id:
             error_message = "You cannot use this button"
             raise yuyo.InteractionError(error_message, component=buttons.delete_row(ctx.author.id))
 
-        if metadata[_HASH_KEY][0] != self._index.hash:
+        if page is None or hash_ != self._index.hash:
             error_message = "This help command instance is out of date"
             raise yuyo.InteractionError(error_message, component=buttons.delete_row(ctx.author.id))
 
-        return int(metadata[_PAGE_NUM_KEY][0])
+        return int(page)
 
     @yuyo.components.as_interactive_button(hikari.ButtonStyle.SECONDARY, emoji=yuyo.pagination.LEFT_DOUBLE_TRIANGLE)
     async def jump_to_start(
@@ -644,7 +818,7 @@ async def _help_command(
         Name of a command to get the full information for.
     """
     if isinstance(ctx, tanjun.abc.AppCommandContext):
-        locale = hikari.Locale(ctx.interaction.locale)
+        locale = _to_locale(ctx.interaction.locale)
 
     else:
         locale = None
@@ -658,7 +832,7 @@ async def _help_command(
             raise tanjun.CommandError(error_message, component=buttons.delete_row(ctx.author.id))
 
         content = content.localise(locale, localiser) if locale else content.default_value
-        if await _check_embed_links(ctx, me):
+        if await _check_embed_links(ctx, me, index.embed_links_cache):
             await ctx.respond(embed=hikari.Embed(description=content), components=components)
 
         else:
@@ -674,16 +848,18 @@ async def _help_command(
             error_message = "No commands"
             raise tanjun.CommandError(error_message) from None
 
-        components = _HelpColumn(index, author=ctx.author.id).rows
+        components = index.column.make_rows(ctx.author.id, 0)
 
-        if await _check_embed_links(ctx, me):
+        if await _check_embed_links(ctx, me, index.embed_links_cache):
             await ctx.respond(embed=page.to_embed(locale=locale, localiser=localiser), components=components)
 
         else:
             await ctx.respond(page.to_content(locale=locale, localiser=localiser), components=components)
 
 
-async def _check_embed_links(ctx: tanjun.abc.Context, me: hikari.OwnUser, /) -> bool:
+async def _check_embed_links(
+    ctx: tanjun.abc.Context, me: hikari.OwnUser, cache: _internal.LRUCache[tuple[int, int, int], tuple[float, bool]], /
+) -> bool:
     if ctx.guild_id is None:
         # The bot will always be able to embed links in DMs
         perms = hikari.Permissions.all_permissions()
@@ -693,11 +869,19 @@ async def _check_embed_links(ctx: tanjun.abc.Context, me: hikari.OwnUser, /) ->
         perms = ctx.interaction.app_permissions
 
     else:
+        key = (me.id, ctx.guild_id, ctx.channel_id)
+        now = time.monotonic()
+        if (entry := cache.get(key)) and entry[0] > now:
+            return entry[1]
+
         # TODO: better handle caching member
         member = ctx.cache.get_member(ctx.guild_id, me) if ctx.cache else None
         member = member or await ctx.rest.fetch_member(ctx.guild_id, me)
         # TODO: this could handle caching the channel and roles better as well
         perms = await tanjun.permissions.fetch_permissions(ctx.client, member, channel=ctx.channel_id)
+        result = (perms & hikari.Permissions.EMBED_LINKS) == hikari.Permissions.EMBED_LINKS
+        cache[key] = (now + _EMBED_LINKS_TTL, result)
+        return result
 
     return (perms & hikari.Permissions.EMBED_LINKS) == hikari.Permissions.EMBED_LINKS
 
@@ -753,6 +937,7 @@ def unload_help(client: tanjun.abc.Client) -> None:
     client.remove_client_callback(tanjun.ClientCallbackNames.COMPONENT_ADDED, index.on_component_change)
     client.remove_client_callback(tanjun.ClientCallbackNames.COMPONENT_REMOVED, index.on_component_change)
     client.injector.remove_type_dependency(_HelpIndex)
+    index.embed_links_cache.clear()
     component_client.deregister_executor(index.column)
     modal_client.deregister_modal(_NUMBERS_MODAL_ID)
 